@@ -231,7 +231,7 @@ class DriveService:
             regex = re.compile(pattern)
             out: list[File] = []
             for file in folder.list():
-                if re.match(regex, file.name):
+                if regex.match(file.name):
                     out.append(file)
             return out
 
@@ -36,6 +36,14 @@ class Column:
     def index(self) -> int:
         return self._index
 
+    @property
+    def values(self) -> list[str]:
+        """
+        The values of all cells in this column, top to bottom.
+        """
+        index = self._index
+        return [row[index] for row in self._sheet.values]
+
     @property
     def metadata(self) -> ColumnDeveloperMetadata:
         if self._metadata is None:
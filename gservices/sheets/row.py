@@ -14,6 +14,9 @@ class Row:
 
     @property
     def index(self) -> int:
+        # A removed row has index -1, and is no longer attached to a sheet
+        if self._index >= 0 and (rows := self._sheet._rows) is not None:
+            rows._locate(self)
         return self._index
 
     @property
@@ -38,7 +41,7 @@ class Row:
 
     @property
     def values(self) -> Sequence[str]:
-        return self._sheet.values[self._index]
+        return self._sheet.values[self.index]
 
     @property
     def metadata(self) -> RowDeveloperMetadata:
@@ -49,15 +52,17 @@ class Row:
 
     @property
     def previous_row(self) -> Row | None:
-        if self._index == 0:
+        index = self.index
+        if index == 0:
             return None
-        return self._sheet.rows[self._index - 1]
+        return self._sheet.rows[index - 1]
 
     @property
     def next_row(self) -> Row | None:
-        if self._index == len(self) - 1:
+        index = self.index
+        if index == len(self) - 1:
             return None
-        return self._sheet.rows[self._index + 1]
+        return self._sheet.rows[index + 1]
 
     def remove(self) -> None:
         """
@@ -65,7 +70,7 @@ class Row:
         moved up. The Row object will become unusable after this call.
         """
         sheet = self._sheet
-        index = self._index
+        index = self.index
         request: gs.DeleteRangeRequest = {
             "shiftDimension": "ROWS",
             "range": {
@@ -92,7 +97,7 @@ class Row:
         specified row, or to the specific row [index].
         """
         sheet = self._sheet
-        old_index = self._index
+        old_index = self.index
         if index is not None:
             new_index = index
         elif before is not None:
@@ -121,7 +126,7 @@ class Row:
         return self._sheet.column_count
 
     def __getitem__(self, col: int) -> Cell:
-        return self._sheet.cell(self._index, col)
+        return self._sheet.cell(self.index, col)
 
     @property
     def _properties(self) -> gs.DimensionProperties:
@@ -129,11 +134,13 @@ class Row:
         grid_data = self._sheet._cell_data
         assert grid_data is not None
         if row_list := grid_data.get("rowMetadata"):
-            if self._index < len(row_list):
-                return row_list[self._index]
+            index = self.index
+            if index < len(row_list):
+                return row_list[index]
         return {}
 
     def _set_property(self, property: str, value: Any) -> None:
+        index = self.index
         update_properties: gs.DimensionProperties = {}
         set_dotted_property(self._properties, property, value)
         set_dotted_property(update_properties, property, value)
@@ -143,8 +150,8 @@ class Row:
                 "range": {
                     "sheetId": self._sheet.id,
                     "dimension": "ROWS",
-                    "startIndex": self._index,
-                    "endIndex": self._index + 1,
+                    "startIndex": index,
+                    "endIndex": index + 1,
                 },
                 "fields": property,
             }
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, Iterator, Callable
+from contextlib import contextmanager
+from typing import Any, Generator, Iterator, Callable
 
 
 class Rows:
@@ -13,11 +14,19 @@ class Rows:
       - iteration, allowing mutation while iterating
     """
 
+    __slots__ = ("_sheet", "_nrows", "_rows", "_iter_index", "_in_bulk", "_stale_from")
+
     def __init__(self, sheet: Sheet):
         self._sheet = sheet
         self._nrows: int | None = None
         self._rows: list[Row | None] | None = None
         self._iter_index: int | None = None
+        # When True, re-indexing of `Row` objects is deferred until the end of the
+        # `bulk()` block.
+        self._in_bulk: bool = False
+        # Within a `bulk()` block, the `Row` objects whose cached indices are at or
+        # above this position may be stale, and are looked up in `_rows` instead.
+        self._stale_from: int | None = None
 
     def __len__(self) -> int:
         """
@@ -49,11 +58,14 @@ class Rows:
         new row is inserted at the bottom of the sheet.
         """
         if before is not None:
-            assert after is None
-            assert 0 <= before <= len(self)
+            if after is not None:
+                raise TypeError("Provide either `before` or `after`, but not both")
+            if not 0 <= before <= len(self):
+                raise IndexError(f"Invalid `before` row index {before}")
             new_index = before
         elif after is not None:
-            assert 0 <= after < len(self)
+            if not 0 <= after < len(self):
+                raise IndexError(f"Invalid `after` row index {after}")
             new_index = after + 1
         else:
             new_index = len(self)
@@ -70,39 +82,50 @@ class Rows:
         })
         self._sheet._handle_row_inserted(new_index)
         self._handle_row_inserted(new_index)
-        return self[new_index]
+        return self._get_trusted(new_index)
 
     def sort(self, key_fn: Callable[[Row], Any], skip_rows: int = 0):
         """
         Sorts all rows (except the first [skip_rows]) according to a sort criteria
         expressed by the [key_fn]
         """
-        sequence: list[tuple[Any, Row]] = []
-        for i in range(skip_rows, len(self)):
-            row = self[i]
-            key = key_fn(row)
-            sequence.append((key, row))
-        sequence.sort()
-        for i, entry in enumerate(sequence):
-            row = entry[1]
-            row.move(index=(i + skip_rows))
+        sequence = [self[i] for i in range(skip_rows, len(self))]
+        sequence.sort(key=key_fn)
+        for i, row in enumerate(sequence, skip_rows):
+            row.move(index=i)
+
+    @contextmanager
+    def bulk(self) -> Generator[Rows, None, None]:
+        """
+        Context manager for inserting / removing / moving many rows at once:
+
+            with sheet.rows.bulk():
+                for row in sheet.rows:
+                    if not row.values[0]:
+                        row.remove()
+
+        Normally each such operation re-indexes all `Row` objects that were created
+        so far, which makes mass mutations quadratic. Within the block, the indices
+        are updated only once, when the block exits; in the meanwhile a Row whose
+        index may have changed looks up its position when the index is requested.
+        """
+        in_bulk = self._in_bulk
+        self._in_bulk = True
+        try:
+            yield self
+        finally:
+            self._in_bulk = in_bulk
+            if not in_bulk and self._stale_from is not None:
+                self._reindex(self._stale_from)
+                self._stale_from = None
 
     def __getitem__(self, index: int) -> Row:
         """
         Returns a Row at the given [index]. The index must be non-negative.
         """
-        assert index >= 0
-        if self._rows is None:
-            rows: list[Row | None] = [None] * len(self)
-            self._rows = rows
-        if index >= len(self._rows):
-            count = index - len(self._rows) + 1
-            self._rows += [None] * count
-        row = self._rows[index]
-        if row is None:
-            row = Row(index, self._sheet)
-            self._rows[index] = row
-        return row
+        if index < 0:
+            raise IndexError(f"Invalid row index {index}")
+        return self._get_trusted(index)
 
     def __iter__(self) -> Iterator[Row]:
         """
@@ -114,45 +137,96 @@ class Rows:
         """
         self._iter_index = 0
         while self._iter_index < len(self):
-            yield self[self._iter_index]
+            yield self._get_trusted(self._iter_index)
             self._iter_index += 1
         self._iter_index = None
 
+    def _get_trusted(self, index: int) -> Row:
+        """
+        Same as `self[index]`, but for internal callers that already know that the
+        [index] is non-negative.
+        """
+        rows = self._rows
+        if rows is None:
+            new_rows: list[Row | None] = [None] * len(self)
+            rows = self._rows = new_rows
+        n = len(rows)
+        if index >= n:
+            rows += [None] * (index - n + 1)
+        row = rows[index]
+        if row is None:
+            row = Row(index, self._sheet)
+            rows[index] = row
+        elif self._in_bulk:
+            row._index = index
+        return row
+
     def _handle_row_removed(self, removed_index: int) -> None:
         if self._nrows is not None:
             self._nrows -= 1
-        if self._iter_index is not None:
-            if removed_index <= self._iter_index:
-                self._iter_index -= 1
-        if self._rows is not None:
-            del self._rows[removed_index]
-            for row in self._rows:
-                if row is not None and row.index > removed_index:
-                    row._index -= 1
+        iter_index = self._iter_index
+        if iter_index is not None and removed_index <= iter_index:
+            self._iter_index = iter_index - 1
+        rows = self._rows
+        if rows is not None:
+            del rows[removed_index]
+            self._invalidate(removed_index)
 
     def _handle_row_inserted(self, inserted_index: int) -> None:
         if self._nrows is not None:
             self._nrows += 1
-        if self._iter_index is not None:
-            if inserted_index <= self._iter_index:
-                self._iter_index += 1
-        if self._rows is not None:
-            self._rows.insert(inserted_index, None)
-            for row in self._rows:
-                if row is not None and row.index >= inserted_index:
-                    row._index += 1
+        iter_index = self._iter_index
+        if iter_index is not None and inserted_index <= iter_index:
+            self._iter_index = iter_index + 1
+        rows = self._rows
+        if rows is not None:
+            rows.insert(inserted_index, None)
+            self._invalidate(inserted_index)
 
     def _handle_row_moved(self, old_index: int, new_index: int) -> None:
-        if self._iter_index is not None:
-            if old_index <= self._iter_index < new_index:
-                self._iter_index -= 1
-            if new_index <= self._iter_index < old_index:
-                self._iter_index += 1
-        if self._rows is not None:
-            array_move(self._rows, old_index, new_index)
-            for i, row in enumerate(self._rows):
-                if row is not None:
-                    row._index = i
+        iter_index = self._iter_index
+        if iter_index is not None:
+            if old_index <= iter_index < new_index:
+                self._iter_index = iter_index - 1
+            elif new_index <= iter_index < old_index:
+                self._iter_index = iter_index + 1
+        rows = self._rows
+        if rows is not None:
+            array_move(rows, old_index, new_index)
+            self._invalidate(min(old_index, new_index))
+
+    def _invalidate(self, start: int) -> None:
+        """
+        Called when the `Row` objects at positions >= [start] have shifted within
+        the `_rows` list.
+        """
+        if not self._in_bulk:
+            self._reindex(start)
+        elif self._stale_from is None or start < self._stale_from:
+            self._stale_from = start
+
+    def _locate(self, row: Row) -> None:
+        """
+        Refreshes the index of a [row] that might have been shifted during the
+        current `bulk()` block.
+        """
+        stale_from = self._stale_from
+        if stale_from is not None and row._index >= stale_from:
+            assert self._rows is not None
+            row._index = self._rows.index(row, stale_from)
+
+    def _reindex(self, start: int) -> None:
+        """
+        Updates the indices of all `Row` objects at positions >= [start] so that
+        they match their positions within the `_rows` list.
+        """
+        rows = self._rows
+        if rows is None:
+            return
+        for i in range(start, len(rows)):
+            row = rows[i]
+            if row is not None:
+                row._index = i
 
 
 from gservices.sheets.row import Row
@@ -10,15 +10,31 @@ class Sheet:
     A single sheet within a spreadsheet.
     """
 
+    __slots__ = (
+        "_spreadsheet",
+        "_properties",
+        "_merges",
+        "_protected",
+        "_metadata",
+        "_rows",
+        "_columns",
+        "_cell_cache",
+        "_row_values_cache",
+        "_cell_values",
+        "_cell_data",
+    )
+
     def __init__(self, data: gs.Sheet, spreadsheet: Spreadsheet):
         self._spreadsheet = spreadsheet
         self._properties: gs.SheetProperties = data.get("properties", {})
         self._merges: list[gs.GridRange] = data.get("merges", [])
         self._protected: list[gs.ProtectedRange] = data.get("protectedRanges", [])
         self._metadata = SheetDeveloperMetadata(data.get("developerMetadata", []), self)
-        self._rows = Rows(self)
-        self._columns = Columns(self)
+        self._rows: Rows | None = None
+        self._columns: Columns | None = None
         self._cell_cache: dict[tuple[int, int], Cell] = {}
+        # Maps row index -> the list of `CellData` for that row within `_cell_data`
+        self._row_values_cache: dict[int, list[gs.CellData]] = {}
         self._cell_values: list[list[str]] | None = None
         self._cell_data: gs.GridData | None = data.get("data", [None])[0]
 
@@ -140,9 +156,11 @@ class Sheet:
     @title.setter
     def title(self, value: str) -> None:
         assert "'" not in value
-        if self.title == value:
+        old_title = self.title
+        if old_title == value:
             return
         self._set_property("title", value)
+        self._spreadsheet._handle_sheet_renamed(self, old_title)
 
     @index.setter
     def index(self, value: int) -> None:
@@ -153,6 +171,7 @@ class Sheet:
         if value == self.hidden:
             return
         self._set_property("hidden", value)
+        self._spreadsheet._sheets_version += 1
 
     @tab_color.setter
     def tab_color(self, value: str | None) -> None:
@@ -192,26 +211,32 @@ class Sheet:
         self._set_property("gridProperties.hideGridlines", value)
 
     def print(self):
-        pprint(f"[bold cyan]Sheet:")
-        pprint(f"  [green]title:[/] [bold white]{self.title}")
-        pprint(f"  [green]id:[/] {self.id}")
-        pprint(f"  [green]index:[/] {self.index}")
-        pprint(f"  [green]type:[/] {self.type}")
-        pprint(f"  [green]hidden:[/] {self.hidden}")
-        pprint(f"  [green]tab_color:[/] {self.tab_color}")
-        pprint(f"  [green]max_row_count:[/] {self.max_row_count}")
-        pprint(f"  [green]max_column_count:[/] {self.max_column_count}")
-        pprint(f"  [green]frozen_row_count:[/] {self.frozen_row_count}")
-        pprint(f"  [green]frozen_column_count:[/] {self.frozen_column_count}")
-        pprint(f"  [green]hide_gridlines:[/] {self.hide_gridlines}")
+        lines = [
+            "[bold cyan]Sheet:[/]",
+            f"  [green]title:[/] [bold white]{self.title}[/]",
+        ]
+        for prop in (
+            "id",
+            "index",
+            "type",
+            "hidden",
+            "tab_color",
+            "max_row_count",
+            "max_column_count",
+            "frozen_row_count",
+            "frozen_column_count",
+            "hide_gridlines",
+        ):
+            lines.append(f"  [green]{prop}:[/] {getattr(self, prop)}")
         if self._cell_data is not None or self._cell_values is not None:
             nrows = len(self.rows)
             ncols = self.column_count
         else:
             nrows = "?"
             ncols = "?"
-        pprint(f"  [green]data:[/] \\[{nrows} x {ncols}]")
-        pprint(f"  [green]metadata:")
+        lines.append(f"  [green]data:[/] \\[{nrows} x {ncols}]")
+        lines.append("  [green]metadata:[/]")
+        pprint("\n".join(lines))
         self.metadata.print(indent="    ")
 
     # ----------------------------------------------------------------------------------
@@ -232,13 +257,15 @@ class Sheet:
             if isinstance(before, Sheet):
                 new_index = before.index
             else:
-                assert 0 <= before <= len(sheets)
+                if not 0 <= before <= len(sheets):
+                    raise IndexError(f"Invalid `before` sheet index {before}")
                 new_index = before
         elif after is not None:
             if isinstance(after, Sheet):
                 new_index = after.index + 1
             else:
-                assert 0 <= after < len(sheets)
+                if not 0 <= after < len(sheets):
+                    raise IndexError(f"Invalid `after` sheet index {after}")
                 new_index = after + 1
         else:
             raise KeyError("Either `before` or `after` argument must be provided")
@@ -251,6 +278,7 @@ class Sheet:
         del sheets[old_index]
         for i, sheet in enumerate(sheets):
             sheet._properties["index"] = i
+        self._spreadsheet._sheets_version += 1
         self._set_property("index", new_index)
 
     def delete(self) -> None:
@@ -258,6 +286,8 @@ class Sheet:
         sheets = self._spreadsheet._sheets
         assert sheets[self.index] is self
         del sheets[self.index]
+        del self._spreadsheet._sheets_by_title[self.title]
+        self._spreadsheet._sheets_version += 1
         for i, sheet in enumerate(sheets):
             sheet._properties["index"] = i
 
@@ -267,15 +297,21 @@ class Sheet:
 
     @property
     def rows(self) -> Rows:
+        if self._rows is None:
+            self._rows = Rows(self)
         return self._rows
 
     @property
     def columns(self) -> Columns:
+        if self._columns is None:
+            self._columns = Columns(self)
         return self._columns
 
     @property
     def column_count(self) -> int:
         if self._cell_data is not None:
+            if (row_values := self._row_values_cache.get(0)) is not None:
+                return len(row_values)
             rows = self._cell_data.get("rowData", [])
             return len(rows[0].get("values", [])) if rows else 0
         else:
@@ -313,17 +349,21 @@ class Sheet:
             return cached_cell
         if row < 0 or column < 0:
             raise ValueError("The `row` and `column` cannot be negative")
-        if self._cell_data is None:
-            self._load_data()
-            assert self._cell_data is not None
-        all_rows = self._cell_data.get("rowData")
-        if all_rows is None:
-            self._cell_data["rowData"] = all_rows = []
-        while row >= len(all_rows):
-            all_rows.append({"values": []})
-        row_values = all_rows[row].get("values")
+        row_values = self._row_values_cache.get(row)
         if row_values is None:
-            all_rows[row]["values"] = row_values = []
+            if self._cell_data is None:
+                self._load_data()
+                assert self._cell_data is not None
+            all_rows = self._cell_data.get("rowData")
+            if all_rows is None:
+                self._cell_data["rowData"] = all_rows = []
+            while row >= len(all_rows):
+                all_rows.append({"values": []})
+            row_data = all_rows[row]
+            row_values = row_data.get("values")
+            if row_values is None:
+                row_data["values"] = row_values = []
+            self._row_values_cache[row] = row_values
         while column >= len(row_values):
             row_values.append({})
         cell = Cell(row, column, row_values[column], self)
@@ -336,18 +376,21 @@ class Sheet:
         """
         if row0 == row1 and col0 == col1:
             return
-        self._spreadsheet._add_request({
-            "mergeCells": {
-                "range": {
-                    "sheetId": self.id,
-                    "startRowIndex": row0,
-                    "endRowIndex": row1 + 1,
-                    "startColumnIndex": col0,
-                    "endColumnIndex": col1 + 1,
-                },
-                "mergeType": "MERGE_ALL",
-            }
-        })
+        self._spreadsheet._add_request(
+            {
+                "mergeCells": {
+                    "range": {
+                        "sheetId": self.id,
+                        "startRowIndex": row0,
+                        "endRowIndex": row1 + 1,
+                        "startColumnIndex": col0,
+                        "endColumnIndex": col1 + 1,
+                    },
+                    "mergeType": "MERGE_ALL",
+                }
+            },
+            idempotent=True,
+        )
 
     # ----------------------------------------------------------------------------------
     # Private
@@ -381,10 +424,7 @@ class Sheet:
         )
         assert data.get("majorDimension") == "ROWS"
         values = cast(list[list[str]], data.get("values", []))
-        n_cols = max(len(row) for row in values)
-        for row in values:
-            if len(row) < n_cols:
-                row += [""] * (n_cols - len(row))
+        _pad_rows(values, "")
         self._cell_values = values
 
     def _fill_values_from_data(self) -> None:
@@ -396,10 +436,7 @@ class Sheet:
                 cell_data.get("formattedValue", "")
                 for cell_data in row.get("values", [])
             ])
-        n_cols = max(len(row) for row in self._cell_values)
-        for row in self._cell_values:
-            if len(row) < n_cols:
-                row += [""] * (n_cols - len(row))
+        _pad_rows(self._cell_values, "")
 
     @property
     def spreadsheet(self) -> Spreadsheet:
@@ -431,9 +468,22 @@ class Sheet:
             if row_meta := cell_data.get("rowMetadata"):
                 del row_meta[removed_row_index]
         if cell_cache := self._cell_cache:
-            remove_keys = [key for key in cell_cache if key[0] == removed_row_index]
-            for key in remove_keys:
-                del cell_cache[key]
+            # Cells of the removed row are dropped, the cells below it move up
+            shifted_cells = [
+                cell for cell in cell_cache.values() if cell._row >= removed_row_index
+            ]
+            for cell in shifted_cells:
+                del cell_cache[(cell._row, cell._column)]
+            for cell in shifted_cells:
+                if cell._row > removed_row_index:
+                    cell._row -= 1
+                    cell_cache[(cell._row, cell._column)] = cell
+        if row_cache := self._row_values_cache:
+            self._row_values_cache = {
+                (i - 1 if i > removed_row_index else i): values
+                for i, values in row_cache.items()
+                if i != removed_row_index
+            }
 
     def _handle_row_inserted(self, inserted_index: int) -> None:
         if self._cell_values is not None:
@@ -446,6 +496,11 @@ class Sheet:
             cell = self._cell_cache.pop(key)
             cell._row += 1
             self._cell_cache[(key[0] + 1, key[1])] = cell
+        if row_cache := self._row_values_cache:
+            self._row_values_cache = {
+                (i + 1 if i >= inserted_index else i): values
+                for i, values in row_cache.items()
+            }
 
     def _handle_row_moved(self, old_index: int, new_index: int) -> None:
         if self._cell_values is not None:
@@ -457,7 +512,33 @@ class Sheet:
                 array_move(row_data, old_index, new_index)
             if row_meta:
                 array_move(row_meta, old_index, new_index)
-        self._cell_cache.clear()
+        # Only the rows between `old_index` and `new_index` change their positions,
+        # so the caches are re-keyed within that window instead of being dropped.
+        if new_index > old_index:
+            lo, hi, shift, final_index = old_index, new_index, -1, new_index - 1
+        else:
+            lo, hi, shift, final_index = new_index, old_index + 1, +1, new_index
+
+        def remap(i: int) -> int:
+            if i == old_index:
+                return final_index
+            if lo <= i < hi:
+                return i + shift
+            return i
+
+        if cell_cache := self._cell_cache:
+            moved_cells = [cell for cell in cell_cache.values() if lo <= cell._row < hi]
+            for cell in moved_cells:
+                del cell_cache[(cell._row, cell._column)]
+            for cell in moved_cells:
+                cell._row = remap(cell._row)
+                cell_cache[(cell._row, cell._column)] = cell
+        if row_cache := self._row_values_cache:
+            moved_rows = [(i, v) for i, v in row_cache.items() if lo <= i < hi]
+            for i, _ in moved_rows:
+                del row_cache[i]
+            for i, v in moved_rows:
+                row_cache[remap(i)] = v
 
     def _handle_cell_value_changed(self, irow: int, icol: int, value: str) -> None:
         rows = self._cell_values
@@ -516,6 +597,24 @@ class Sheet:
         assert self.frozen_column_count <= self.max_column_count
 
 
+def _pad_rows(rows: list[list[Any]], fill: Any) -> None:
+    """
+    Pads all [rows] with the [fill] value so that they have the same length.
+
+    In the common case the rows are already rectangular, and then the function exits
+    after a single scan that stops at the first row with a different length.
+    """
+    if not rows:
+        return
+    n_cols = len(rows[0])
+    if all(len(row) == n_cols for row in rows):
+        return
+    n_cols = max(len(row) for row in rows)
+    for row in rows:
+        if len(row) < n_cols:
+            row += [fill] * (n_cols - len(row))
+
+
 from gservices.sheets.cell import Cell
 from gservices.sheets.columns import Columns
 from gservices.sheets.developer_metadata import SheetDeveloperMetadata
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
 
 
 class SheetsService:
+    __slots__ = ("_resource", "_google")
+
     @staticmethod
     def build(credentials: Credentials, google: GoogleServices) -> SheetsService:
         from googleapiclient.discovery import build  # type: ignore
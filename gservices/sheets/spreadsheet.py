@@ -1,4 +1,6 @@
 from __future__ import annotations
+from collections import deque
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 if TYPE_CHECKING:
@@ -32,39 +34,51 @@ class Spreadsheet:
         self._sheets = [
             Sheet(data=item, spreadsheet=self) for item in data.get("sheets", [])
         ]
-        # The list of all updates that are scheduled to be applied to the spreadsheet
-        # on the next `save()`.
-        self._pending_updates: list[gs.Request] = []
-        self._pending_callbacks: list[Callable[[gs.Response], None] | None] = []
+        self._sheets_by_title: dict[str, Sheet] = {s.title: s for s in self._sheets}
+        # The largest sheet ID ever seen in this spreadsheet. IDs of deleted sheets
+        # are not reused.
+        self._max_sheet_id: int = max((s.id for s in self._sheets), default=0)
+        # Incremented whenever a sheet is added, removed, moved, hidden or unhidden.
+        self._sheets_version: int = 0
+        self._visible_sheets_cache: tuple[int, tuple[Sheet, ...]] | None = None
+        # The queue of all updates that are scheduled to be applied to the spreadsheet
+        # on the next `save()`, each paired with an optional callback for its reply.
+        self._pending: deque[tuple[gs.Request, Callable[[gs.Response], None] | None]]
+        self._pending = deque()
+        # The `request_merge_key()` of the last request in `_pending`.
+        self._last_merge_key: tuple[Any, ...] | None = None
 
     def save(self) -> None:
         """
         Saves any pending changes to the spreadsheet file stored in Google Cloud.
+
+        The changes are uploaded in batches of up to `BATCH_SIZE` requests. The
+        batches are sent one after another, never concurrently: the Sheets API
+        applies requests in order, and later requests depend on the effects of the
+        earlier ones (e.g. a row insertion shifts all cells updated after it).
         """
-        if not self._pending_updates:
+        pending = self._pending
+        if not pending:
             return
-        i0 = 0
-        while i0 < len(self._pending_updates):
-            updates = self._pending_updates[i0 : i0 + Spreadsheet.BATCH_SIZE]
-            response = (
-                self._service.resource.spreadsheets()
-                .batchUpdate(
-                    spreadsheetId=self._id,
-                    body={
-                        "requests": updates,
-                        "includeSpreadsheetInResponse": False,
-                    },
-                )
-                .execute()
-            )
+        batch_update = self._service.resource.spreadsheets().batchUpdate
+        while pending:
+            batch = list(islice(pending, Spreadsheet.BATCH_SIZE))
+            updates = [request for request, _ in batch]
+            response = batch_update(
+                spreadsheetId=self._id,
+                body={
+                    "requests": updates,
+                    "includeSpreadsheetInResponse": False,
+                },
+            ).execute()
+            for _ in batch:
+                pending.popleft()
+            if not pending:
+                self._last_merge_key = None
             replies = response.get("replies", [])
-            for i, reply in enumerate(replies):
-                callback = self._pending_callbacks[i + i0]
+            for reply, (_, callback) in zip(replies, batch):
                 if callback:
                     callback(reply)
-            i0 += Spreadsheet.BATCH_SIZE
-        self._pending_updates = []
-        self._pending_callbacks = []
 
     # ----------------------------------------------------------------------------------
     # Basic properties
@@ -155,27 +169,32 @@ class Spreadsheet:
         return file
 
     def print(self):
-        pprint(f"[bold cyan]Spreadsheet:")
-        pprint(f"  [green]title:[/] [bold white]{self.title}")
-        pprint(f"  [green]id:[/] {self.id}")
-        pprint(f"  [green]url:[/] {self.url}")
-        pprint(f"  [green]locale:[/] {self.locale}")
-        pprint(f"  [green]time_zone:[/] {self.time_zone}")
-        pprint(f"  [green]theme:[/]")
-        pprint(f"    [green]font_family:[/] {self.theme.get('primaryFontFamily')}")
-        pprint(f"    [green]colors:[/]")
-        for record in self.theme.get("themeColors", []):
+        # Lines are accumulated and printed in as few calls as possible, since each
+        # call has to parse the markup anew.
+        theme = self.theme
+        lines = [
+            "[bold cyan]Spreadsheet:[/]",
+            f"  [green]title:[/] [bold white]{self.title}[/]",
+        ]
+        for prop in ("id", "url", "locale", "time_zone"):
+            lines.append(f"  [green]{prop}:[/] {getattr(self, prop)}")
+        lines.append("  [green]theme:[/]")
+        lines.append(f"    [green]font_family:[/] {theme.get('primaryFontFamily')}")
+        lines.append("    [green]colors:[/]")
+        for record in theme.get("themeColors", []):
             color = color_object_to_string(record.get("color", {}))
-            pprint(f"      [green]{record.get('colorType')}:[/] {color}")
-        pprint(f"  [green]cell_format:")
+            lines.append(f"      [green]{record.get('colorType')}:[/] {color}")
+        lines.append("  [green]cell_format:[/]")
+        pprint("\n".join(lines))
         self.default_cell_format.print(indent="    ")
-        pprint(f"  [green]sheets:")
+        lines = ["  [green]sheets:[/]"]
         for sheet in self.sheets:
-            pprint(
+            lines.append(
                 f"    [magenta not bold]\\[{sheet.index}][/]: "
                 f"[bold white]{sheet.title}[/], id={sheet.id}"
             )
-        pprint(f"  [green]metadata:")
+        lines.append("  [green]metadata:[/]")
+        pprint("\n".join(lines))
         self.metadata.print(indent="    ")
 
     # ----------------------------------------------------------------------------------
@@ -193,30 +212,32 @@ class Spreadsheet:
         return self._sheets
 
     @property
-    def visible_sheets(self) -> list[Sheet]:
+    def visible_sheets(self) -> Sequence[Sheet]:
         """
         The list of sheets excluding any hidden sheets.
         """
-        return [sheet for sheet in self._sheets if not sheet.hidden]
+        cache = self._visible_sheets_cache
+        if cache is None or cache[0] != self._sheets_version:
+            visible = tuple(sheet for sheet in self._sheets if not sheet.hidden)
+            cache = (self._sheets_version, visible)
+            self._visible_sheets_cache = cache
+        return cache[1]
 
     def sheet(self, name: str) -> Sheet | None:
         """
         Finds a sheet with the given [name], or returns None if a sheet with such
         name does not exist.
         """
-        for sheet in self._sheets:
-            if sheet.title == name:
-                return sheet
-        return None
+        return self._sheets_by_title.get(name)
 
     def add_sheet(self, name: str) -> Sheet:
         """
         Creates a new sheet with the given [name] and adds it at the end of the
         sheet list.
         """
-        max_id = max(sheet.id for sheet in self._sheets)
+        self._max_sheet_id += 1
         properties: gs.SheetProperties = {
-            "sheetId": max_id + 1,
+            "sheetId": self._max_sheet_id,
             "sheetType": "GRID",
             "title": name,
             "index": len(self._sheets),
@@ -224,6 +245,8 @@ class Spreadsheet:
         self._add_request({"addSheet": {"properties": properties}})
         sheet = Sheet({"properties": properties}, self)
         self._sheets.append(sheet)
+        self._sheets_by_title[name] = sheet
+        self._sheets_version += 1
         return sheet
 
     def delete_sheet(self, sheet: Sheet | str) -> None:
@@ -231,7 +254,7 @@ class Spreadsheet:
         Deletes the given [sheet] from the spreadsheet.
         """
         if isinstance(sheet, str):
-            sheet_obj = self.sheet(sheet)
+            sheet_obj = self._sheets_by_title.get(sheet)
             if not sheet_obj:
                 raise KeyError(f"Sheet `{sheet}` does not exist in the spreadsheet")
             sheet = sheet_obj
@@ -249,14 +272,14 @@ class Spreadsheet:
         Moves the [sheet] either [before] or [after] another sheet.
         """
         if isinstance(sheet, str):
-            sheet_obj = self.sheet(sheet)
+            sheet_obj = self._sheets_by_title.get(sheet)
             if sheet_obj is None:
                 raise KeyError(f"Unknown sheet name {sheet!r}")
         else:
             sheet_obj = sheet
         if before is not None:
             if isinstance(before, str):
-                before_sheet = self.sheet(before)
+                before_sheet = self._sheets_by_title.get(before)
                 if not before_sheet:
                     raise KeyError(f"Unknown `before` sheet {before!r}")
                 before = before_sheet.index
@@ -264,7 +287,7 @@ class Spreadsheet:
                 before = before.index
         if after is not None:
             if isinstance(after, str):
-                after_sheet = self.sheet(after)
+                after_sheet = self._sheets_by_title.get(after)
                 if not after_sheet:
                     raise KeyError(f"Unknown `after` sheet {after!r}")
                 after = after_sheet.index
@@ -276,11 +299,19 @@ class Spreadsheet:
     # Private
     # ----------------------------------------------------------------------------------
 
+    def __contains__(self, name: str) -> bool:
+        """
+        Returns True if the spreadsheet has a sheet with the given [name].
+        """
+        return name in self._sheets_by_title
+
     def __repr__(self) -> str:
         n = len(self._sheets)
         return f"Spreadsheet({self.title!r}, id='{self.id}', #sheets={n})"
 
     def _set_property(self, property: str, value: Any) -> None:
+        if get_dotted_property(self._properties, property, MISSING) == value:
+            return
         update_properties: gs.SpreadsheetProperties = {}
         set_dotted_property(self._properties, property, value)
         set_dotted_property(update_properties, property, value)
@@ -295,19 +326,39 @@ class Spreadsheet:
         self,
         request: gs.Request,
         callback: Callable[[gs.Response], None] | None = None,
+        idempotent: bool = False,
     ) -> None:
-        if not callback and self._pending_updates:
-            previous_request = self._pending_updates[-1]
+        """
+        Schedules the [request] to be sent on the next `save()`.
+
+        Set [idempotent] to True if applying the request twice has the same effect
+        as applying it once. Such a request is dropped when it is identical to the
+        last pending request. Identical requests that are further apart are not
+        deduplicated, since some other request in between may undo their effect.
+        """
+        if idempotent and not callback and self._pending:
+            if self._pending[-1] == (request, None):
+                return
+        merge_key = request_merge_key(request)
+        if not callback and merge_key is not None and merge_key == self._last_merge_key:
+            previous_request, _ = self._pending[-1]
             if merge_requests(previous_request, request):
                 return
-        self._pending_updates.append(request)
-        self._pending_callbacks.append(callback)
+        self._pending.append((request, callback))
+        self._last_merge_key = merge_key
+
+    def _handle_sheet_renamed(self, sheet: Sheet, old_title: str) -> None:
+        if self._sheets_by_title.get(old_title) is sheet:
+            del self._sheets_by_title[old_title]
+        self._sheets_by_title[sheet.title] = sheet
 
     def _check_integrity(self) -> None:
         for i, sheet in enumerate(self.sheets):
             assert sheet._spreadsheet is self
             assert sheet.index == i
+            assert self._sheets_by_title.get(sheet.title) is sheet
             sheet._check_integrity()
+        assert len(self._sheets_by_title) == len(self._sheets)
 
 
 from gservices.drive.spreadsheet_file import SpreadsheetFile
@@ -316,8 +367,11 @@ from gservices.sheets.developer_metadata import SpreadsheetDeveloperMetadata
 from gservices.sheets.sheet import Sheet
 from gservices.sheets.sheets_service import SheetsService
 from gservices.sheets.utils import (
+    MISSING,
     color_object_to_string,
+    get_dotted_property,
     merge_requests,
+    request_merge_key,
     set_dotted_property,
 )
 from gservices.print_utils import pprint
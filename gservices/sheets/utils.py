@@ -1,11 +1,13 @@
 from __future__ import annotations
+import functools
 import re
-from typing import TYPE_CHECKING, Any, Mapping, cast
+from typing import TYPE_CHECKING, Any, Callable, Mapping, cast
 
 if TYPE_CHECKING:
     import googleapiclient._apis.sheets.v4.schemas as gs  # type: ignore[reportMissingModuleSource]
 
 AnyDict = dict[str, Any]
+MISSING: Any = object()
 ADDRESS_PATTERN = re.compile(r"^([A-Z]+)(\d+)$")
 
 
@@ -19,14 +21,36 @@ def coords_to_address(row: int, col: int) -> str:
     """
     if row < 0 or col < 0:
         raise ValueError(f"Invalid cell coordinates: ({row}, {col})")
-    addr = str(row + 1)
+    return _column_letters(col) + str(row + 1)
+
+
+# Letter names of the columns "A", "B", ..., filled lazily by `_column_letters()`.
+# Only the columns that can exist in Google Sheets are cached.
+_COLUMN_LETTERS: list[str] = []
+_MAX_CACHED_COLUMNS = 18278  # "ZZZ"
+
+
+def _column_letters(col: int) -> str:
+    if col < len(_COLUMN_LETTERS):
+        return _COLUMN_LETTERS[col]
+    if col < _MAX_CACHED_COLUMNS:
+        for i in range(len(_COLUMN_LETTERS), col + 1):
+            _COLUMN_LETTERS.append(_compute_column_letters(i))
+        return _COLUMN_LETTERS[col]
+    return _compute_column_letters(col)
+
+
+def _compute_column_letters(col: int) -> str:
+    letters = bytearray()
     i = col + 1
     while i:
-        addr = chr(ord("A") + ((i - 1) % 26)) + addr
+        letters.append(ord("A") + ((i - 1) % 26))
         i = (i - 1) // 26
-    return addr
+    letters.reverse()
+    return letters.decode("ascii")
 
 
+@functools.lru_cache(maxsize=65536)
 def address_to_coords(addr: str) -> tuple[int, int]:
     """
     Converts the address of a cell from excel notation to a row/column pair,
@@ -35,14 +59,26 @@ def address_to_coords(addr: str) -> tuple[int, int]:
     For example:
         address_to_coords("B102") == (1, 101)
     """
-    match = re.match(ADDRESS_PATTERN, addr)
-    if not match:
-        raise ValueError(f"Invalid cell address: {addr!r}")
-    row = int(match.group(2))
+    # A hand-rolled equivalent of matching against `ADDRESS_PATTERN`, restricted
+    # to ASCII digits.
+    row = 0
     col = 0
-    for ch in match.group(1):
-        col = col * 26 + (ord(ch) - 64)  # 64 == ord('A') - 1
-    return (row - 1, col - 1)
+    in_row = False
+    for ch in addr:
+        code = ord(ch)
+        if 48 <= code <= 57:  # '0'..'9'
+            if not col:
+                break
+            row = row * 10 + (code - 48)
+            in_row = True
+        elif 65 <= code <= 90 and not in_row:  # 'A'..'Z'
+            col = col * 26 + (code - 64)  # 64 == ord('A') - 1
+        else:
+            break
+    else:
+        if in_row:
+            return (row - 1, col - 1)
+    raise ValueError(f"Invalid cell address: {addr!r}")
 
 
 def color_object_to_string(color_style: gs.ColorStyle | None) -> str | None:
@@ -80,20 +116,25 @@ def color_string_to_object(color: str | None) -> "gs.ColorStyle":
                 rgb["alpha"] = alpha
         return {"rgbColor": rgb}
     else:
-        assert color in (
-            "TEXT",
-            "BACKGROUND",
-            "ACCENT1",
-            "ACCENT2",
-            "ACCENT3",
-            "ACCENT4",
-            "ACCENT5",
-            "ACCENT6",
-            "LINK",
-        )
+        assert color in _THEME_COLORS
         return {"themeColor": color}
 
 
+_THEME_COLORS = frozenset(
+    (
+        "TEXT",
+        "BACKGROUND",
+        "ACCENT1",
+        "ACCENT2",
+        "ACCENT3",
+        "ACCENT4",
+        "ACCENT5",
+        "ACCENT6",
+        "LINK",
+    )
+)
+
+
 def array_move(arr: list[Any], old_index: int, new_index: int):
     value = arr[old_index]
     del arr[old_index]
@@ -103,11 +144,28 @@ def array_move(arr: list[Any], old_index: int, new_index: int):
 
 
 def _float_to_hexstr(x: float) -> str:
-    return f"{int(x * 255 + 0.1):02x}"
+    n = int(x * 255 + 0.1)
+    if 0 <= n < 256:
+        return _BYTE_TO_HEXSTR[n]
+    return f"{n:02x}"
 
 
 def _hexstr_to_float(hex: str) -> float:
-    return int(hex, base=16) / 255
+    value = _HEXSTR_TO_FLOAT.get(hex)
+    if value is None:
+        return int(hex, base=16) / 255
+    return value
+
+
+# Lookup tables for color channel conversions; the keys of `_HEXSTR_TO_FLOAT`
+# include every upper/lower-case spelling of each byte.
+_BYTE_TO_HEXSTR = [f"{i:02x}" for i in range(256)]
+_HEXSTR_TO_FLOAT = {
+    a + b: i / 255
+    for i, hexstr in enumerate(_BYTE_TO_HEXSTR)
+    for a in {hexstr[0], hexstr[0].upper()}
+    for b in {hexstr[1], hexstr[1].upper()}
+}
 
 
 def set_dotted_property(target: Mapping[str, Any], key: str, value: Any) -> None:
@@ -116,16 +174,43 @@ def set_dotted_property(target: Mapping[str, Any], key: str, value: Any) -> None
     "format.color"), then creates a nested dictionary `target["format"]["color"] =
     value`.
     """
-    assert isinstance(target, dict)
-    if "." in key:
-        parts = key.split(".", 1)
-        if parts[0] in target:
-            assert isinstance(target[parts[0]], dict)
-        else:
-            target[parts[0]] = {}
-        set_dotted_property(target[parts[0]], parts[1], value)
-    else:
+    if "." not in key:
+        assert isinstance(target, dict)
         target[key] = value
+        return
+    parts, last = _split_dotted_key(key)
+    for part in parts:
+        assert isinstance(target, dict)
+        target = target.setdefault(part, {})
+    assert isinstance(target, dict)
+    target[last] = value
+
+
+def get_dotted_property(
+    source: Mapping[str, Any], key: str, default: Any = None
+) -> Any:
+    """
+    Returns `source[key]`, where the [key] can be a dot-string such as
+    "format.color" (see [set_dotted_property]). If the property does not exist,
+    returns the [default] value.
+    """
+    value: Any = source
+    parts, last = _split_dotted_key(key)
+    for part in (*parts, last):
+        if not isinstance(value, dict) or part not in value:
+            return default
+        value = cast(AnyDict, value)[part]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _split_dotted_key(key: str) -> tuple[tuple[str, ...], str]:
+    """
+    Splits a dot-string [key] into the tuple of its parent keys and the last key.
+    Property keys come from a small set, so their splits are memoized.
+    """
+    *parts, last = key.split(".")
+    return (tuple(parts), last)
 
 
 def merge_requests(request0: gs.Request, request1: gs.Request) -> bool:
@@ -135,9 +220,40 @@ def merge_requests(request0: gs.Request, request1: gs.Request) -> bool:
     If successful, returns `True` and modifies [request0] to incorporate data from
     [request1]. Returns `False` if merge is not possible.
     """
-    return merge_delete_range(
-        request0.get("deleteRange"), request1.get("deleteRange")
-    ) or merge_update_cells(request0.get("updateCells"), request1.get("updateCells"))
+    # A request has exactly one key, which identifies the kind of the request
+    kind = next(iter(request0), "")
+    merger = _MERGERS.get(kind)
+    if merger is None or len(request0) != 1 or request1.keys() != request0.keys():
+        return False
+    return merger(
+        cast(AnyDict, request0.get(kind)), cast(AnyDict, request1.get(kind))
+    )
+
+
+def request_merge_key(request: gs.Request) -> tuple[Any, ...] | None:
+    """
+    Returns a key that summarizes which requests the [request] can be merged with
+    by [merge_requests]: a merge is only possible if both requests have the same
+    key, and the key is not None.
+    """
+    # A request has exactly one key, which identifies the kind of the request
+    kind = next(iter(request), "")
+    if kind not in MERGEABLE_REQUESTS or len(request) != 1:
+        return None
+    body = cast(AnyDict, request.get(kind))
+    if kind == "updateCells":
+        start = body.get("start", {})
+        return (
+            kind,
+            start.get("sheetId"),
+            start.get("rowIndex"),
+            start.get("columnIndex"),
+        )
+    return (
+        kind,
+        body.get("range", {}).get("sheetId"),
+        body.get("shiftDimension"),
+    )
 
 
 def merge_delete_range(
@@ -153,32 +269,21 @@ def merge_delete_range(
         range1 = req1.get("range", {})
         if range0.get("sheetId") != range1.get("sheetId"):
             return False
-        range0_row0 = range0.get("startRowIndex")
-        range0_row1 = range0.get("endRowIndex")
-        range1_row0 = range1.get("startRowIndex")
-        range1_row1 = range1.get("endRowIndex")
-        range0_col0 = range0.get("startColumnIndex")
-        range0_col1 = range0.get("endColumnIndex")
-        range1_col0 = range1.get("startColumnIndex")
-        range1_col1 = range1.get("endColumnIndex")
-        if (
-            range0_row0 is not None
-            and range0_row1 is not None
-            and range1_row0 is not None
-            and range1_row1 is not None
-            and range0_row0 == range1_row0
-        ):
-            range0["endRowIndex"] = range0_row1 + (range1_row1 - range1_row0)
-            return True
-        if (
-            range0_col0 is not None
-            and range0_col1 is not None
-            and range1_col0 is not None
-            and range1_col1 is not None
-            and range0_col0 == range1_col0
-        ):
-            range0["endColumnIndex"] = range0_col1 + (range1_col1 - range1_col0)
-            return True
+        # Only look up the end indices once the start indices are known to match
+        row0 = range0.get("startRowIndex")
+        if row0 is not None and row0 == range1.get("startRowIndex"):
+            end0 = range0.get("endRowIndex")
+            end1 = range1.get("endRowIndex")
+            if end0 is not None and end1 is not None:
+                range0["endRowIndex"] = end0 + (end1 - row0)
+                return True
+        col0 = range0.get("startColumnIndex")
+        if col0 is not None and col0 == range1.get("startColumnIndex"):
+            end0 = range0.get("endColumnIndex")
+            end1 = range1.get("endColumnIndex")
+            if end0 is not None and end1 is not None:
+                range0["endColumnIndex"] = end0 + (end1 - col0)
+                return True
     return False
 
 
@@ -188,44 +293,63 @@ def merge_update_cells(
 ) -> bool:
     # Two UpdateCells requests can be merged if they refer to the same cell
     if req0 and req1:
-        start0 = req0.get("start")
-        start1 = req1.get("start")
-        if not (start0 and start0 == start1):
+        get0 = req0.get
+        get1 = req1.get
+        start0 = get0("start")
+        if not (start0 and start0 == get1("start")):
             return False
-        rows0 = req0.get("rows")
-        rows1 = req1.get("rows")
-        if not (rows0 and rows1 and len(rows0) == len(rows1) and len(rows0) == 1):
+        rows0 = get0("rows")
+        rows1 = get1("rows")
+        if not (rows0 and rows1 and len(rows0) == 1 and len(rows1) == 1):
             return False
         values0 = rows0[0].get("values")
         values1 = rows1[0].get("values")
-        if not (
-            values0 and values1 and len(values0) == len(values1) and len(values0) == 1
-        ):
+        if not (values0 and values1 and len(values0) == 1 and len(values1) == 1):
             return False
         props0 = values0[0]
         props1 = values1[0]
         merge_structs(cast(AnyDict, props0), cast(AnyDict, props1))
-        fields0 = req0.get("fields", "")
-        fields1 = req1.get("fields", "")
-        fields_both = set(fields0.split(",") + fields1.split(","))
-        req0["fields"] = ",".join(sorted(fields_both))
+        req0["fields"] = _merge_fields(get0("fields", ""), get1("fields", ""))
         return True
     return False
 
 
+_MERGERS: dict[str, Callable[[Any, Any], bool]] = {
+    "deleteRange": merge_delete_range,
+    "updateCells": merge_update_cells,
+}
+
+# Kinds of requests that [merge_requests] is able to merge
+MERGEABLE_REQUESTS = frozenset(_MERGERS)
+
+
+@functools.lru_cache(maxsize=1024)
+def _merge_fields(fields0: str, fields1: str) -> str:
+    """
+    Combines two comma-separated field masks into one, sorted alphabetically.
+    """
+    fields_both = set(fields0.split(",") + fields1.split(","))
+    return ",".join(sorted(fields_both))
+
+
 def merge_structs(struct1: dict[str, Any], struct2: dict[str, Any]):
-    for key in struct2:
-        if key in struct1:
-            if isinstance(struct1[key], dict) and isinstance(struct2[key], dict):
-                merge_structs(struct1[key], struct2[key])
-                continue
-        struct1[key] = struct2[key]
+    stack = [(struct1, struct2)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            existing = target.get(key, MISSING)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                stack.append((cast(AnyDict, existing), cast(AnyDict, value)))
+            else:
+                target[key] = value
 
 
 def cell_formats_equal(
     format1: gs.CellFormat | None, format2: gs.CellFormat | None
 ) -> bool:
-    return (format1 is None and format2 is None) or (
+    if format1 is format2 or format1 == format2:
+        return True
+    return (
         (format1 is not None and format2 is not None)
         and _color_style_equal(
             format1.get("backgroundColorStyle"), format2.get("backgroundColorStyle")
@@ -269,6 +393,10 @@ def _border_equal(border1: gs.Border | None, border2: gs.Border | None) -> bool:
 
 
 def _color_style_equal(bg1: gs.ColorStyle | None, bg2: gs.ColorStyle | None) -> bool:
+    if bg1 is bg2 or bg1 == bg2:
+        return True
+    # Different objects may still describe the same color, for example when a
+    # channel is omitted in one of them and set to 0 in the other.
     return color_object_to_string(bg1) == color_object_to_string(bg2)
 
 